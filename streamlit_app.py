@@ -1,14 +1,107 @@
+import functools
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import Dict, List, Optional
 from datetime import datetime, timezone, timedelta
 
-import requests
+import orjson
 import streamlit as st
 
 
+def _requests():
+    """Import requests lazily (it drags in urllib3, idna, charset-normalizer).
+
+    Deferring the import keeps Streamlit cold starts and module reloads
+    cheaper; after the first call it's just a sys.modules lookup.
+    """
+    import requests
+
+    return requests
+
+
 # --- App constants
 DEFAULT_BACKEND_URL = "https://dominant-usually-oyster.ngrok-free.app"
 
+# Compiled once so validation doesn't pay the re-cache lookup on every rerun.
+_E164_RE = re.compile(r"\+?[1-9]\d{7,14}")
+
+# Stale-while-revalidate windows for the personas snapshot (seconds).
+PERSONAS_SOFT_TTL = 300
+PERSONAS_HARD_TTL = 3600
+
+# SWR store for personas snapshots, keyed by backend URL. Lives at module
+# level (not st.session_state) so executor workers — which have no Streamlit
+# ScriptRunContext — can read and write it, and so one snapshot serves every
+# session on the process. Entries: {"data": ..., "ts": ..., "refreshing": ...}.
+_personas_swr_lock = threading.Lock()
+_personas_swr: Dict[str, dict] = {}
+
+# IST timezone (UTC+5:30), built once instead of per format_timestamp call.
+_IST = timezone(timedelta(hours=5, minutes=30))
+
+
+# --- Shared HTTP session
+@st.cache_resource(show_spinner=False)
+def get_http_session() -> "requests.Session":
+    """Build the shared pooled Session for all backend calls.
+
+    Cached as a Streamlit resource so one connection pool (with keep-alive
+    and a small retry policy for transient 502/503/504s from the tunnel) is
+    shared across reruns and across all browser sessions on this process.
+    """
+    requests = _requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    s = requests.Session()
+    # Retry transient tunnel errors with backoff, but only on GET/HEAD —
+    # /call POSTs are not idempotent and must surface failures immediately.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=retry,
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(
+        {
+            "User-Agent": "VishNet-Streamlit/1.0",
+            "Accept": "application/json",
+            # Offer brotli alongside gzip (the brotli package is installed so
+            # urllib3 can decode it); report transcripts shrink several-fold
+            # on the wire.
+            "Accept-Encoding": "gzip, br",
+        }
+    )
+    return s
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for background and parallel backend fetches.
+
+    One pool per server process; workers share the pooled Session, so
+    concurrent GETs reuse keep-alive connections instead of serializing
+    round-trips. Sized for the per-call detail fan-out in fetch_calls
+    (network-bound; the GIL is released on socket I/O).
+
+    Jobs submitted here run without a Streamlit ScriptRunContext: they must
+    not read or write st.session_state (writes land in a throwaway state) —
+    pass inputs like backend_url as arguments and hand results back through
+    module-level stores, as _bg_refresh_personas and fetch_calls do.
+    """
+    return ThreadPoolExecutor(max_workers=16)
+
 
 st.set_page_config(
     page_title="VishNet – AI Powered Vishing Simulation & Defense",
@@ -18,22 +111,44 @@ st.set_page_config(
 
 
 # --- Data fetching helpers
-@st.cache_data(ttl=30, show_spinner=False)
-def fetch_personas() -> Dict[str, List[str]]:
-    """Fetch personas from backend.
-
-    Returns a dict: {"normal": [...], "impersonation": [...]}.
-    Raises RuntimeError on any failure.
+# cache_resource (not cache_data) so cache hits return the shared snapshot by
+# reference instead of pickling/copying it on every lookup; invalidation goes
+# through fetch_bootstrap.clear() in refresh_personas, and callers treat the
+# dict as read-only.
+@st.cache_resource(ttl=3600, show_spinner=False)
+def fetch_bootstrap(backend_url: str) -> Dict[str, dict]:
+    """Fetch all UI bootstrap data from the backend in one round-trip.
+
+    Prefers the batched /bootstrap endpoint, which returns personas plus any
+    other UI config in a single document, so new data dependencies don't add
+    extra HTTP round-trips. Falls back to /personas on backends that don't
+    serve /bootstrap yet.
+
+    Returns a dict: {"personas": {"normal": [...], "impersonation": [...]},
+    "config": {...}}. Raises RuntimeError on any failure.
+
+    Cached generously (1h) and keyed on backend_url — like the calls/report
+    fetchers — so a sidebar URL change misses the cache instead of serving
+    the old backend's personas. The persona list itself only changes after
+    an impersonation call, which invalidates explicitly via
+    refresh_personas().
     """
+    requests = _requests()
     try:
-        backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
-        resp = requests.get(f"{backend_url}/personas", timeout=15)
+        session = get_http_session()
+        resp = session.get(f"{backend_url}/bootstrap", timeout=15)
+        if resp.status_code == 404:
+            resp = session.get(f"{backend_url}/personas", timeout=15)
         resp.raise_for_status()
-        data = resp.json() or {}
+        # orjson parses straight from bytes, skipping requests' str decode.
+        data = (orjson.loads(resp.content) if resp.content else {}) or {}
         personas = data.get("personas") or {}
         return {
-            "normal": list(personas.get("normal") or []),
-            "impersonation": list(personas.get("impersonation") or []),
+            "personas": {
+                "normal": list(personas.get("normal") or []),
+                "impersonation": list(personas.get("impersonation") or []),
+            },
+            "config": dict(data.get("config") or {}),
         }
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to fetch personas: {e}") from e
@@ -41,10 +156,116 @@ def fetch_personas() -> Dict[str, List[str]]:
         raise RuntimeError("Invalid response while fetching personas") from e
 
 
+def fetch_personas(backend_url: str) -> Dict[str, List[str]]:
+    """Return the personas slice of the bootstrap document."""
+    return fetch_bootstrap(backend_url)["personas"]
+
+
 def refresh_personas() -> Dict[str, List[str]]:
     """Clear the cache and refetch personas."""
-    fetch_personas.clear()
-    return fetch_personas()
+    backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
+    fetch_bootstrap.clear()
+    return _store_personas(backend_url, fetch_personas(backend_url))
+
+
+def _store_personas(backend_url: str, data: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Record a fresh personas snapshot (and its age) for a backend URL."""
+    with _personas_swr_lock:
+        entry = _personas_swr.setdefault(backend_url, {})
+        entry["data"] = data
+        entry["ts"] = time.time()
+    return data
+
+
+def _bg_refresh_personas(backend_url: str) -> None:
+    """Background revalidation: refetch personas and store the result."""
+    try:
+        fetch_bootstrap.clear()
+        _store_personas(backend_url, fetch_personas(backend_url))
+    except Exception:
+        # Keep serving the stale snapshot; the next hard-TTL miss will surface errors.
+        pass
+    finally:
+        with _personas_swr_lock:
+            entry = _personas_swr.get(backend_url)
+            if entry is not None:
+                entry["refreshing"] = False
+
+
+def get_personas_swr() -> Dict[str, List[str]]:
+    """Serve cached personas immediately, revalidating stale data off-thread.
+
+    Within the soft TTL the cached dict is returned as-is. Between the soft
+    and hard TTLs the stale dict is still returned, but a worker refreshes
+    the module-level store in the background so the UI never blocks on the
+    backend. Only a hard-TTL miss (or first load) falls back to a
+    synchronous fetch. Must be called from the script thread.
+    """
+    backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
+    with _personas_swr_lock:
+        entry = _personas_swr.get(backend_url) or {}
+        cached = entry.get("data")
+        age = time.time() - entry.get("ts", 0)
+        revalidate = (
+            cached is not None
+            and PERSONAS_SOFT_TTL < age < PERSONAS_HARD_TTL
+            and not entry.get("refreshing")
+        )
+        if revalidate:
+            entry["refreshing"] = True
+    if cached is not None and age < PERSONAS_HARD_TTL:
+        if revalidate:
+            get_executor().submit(_bg_refresh_personas, backend_url)
+        return cached
+    return _store_personas(backend_url, fetch_personas(backend_url))
+
+
+@st.fragment
+def persona_form_block() -> None:
+    """Persona and voice selection, scoped to a fragment.
+
+    Interacting with these widgets reruns only this block instead of the whole
+    script. Values are exposed to the submit handler via the "mode", "persona"
+    and "voice_id" session-state keys. Personas are read from session state
+    here rather than taken as an argument: fragment reruns replay the
+    arguments bound at the last full script run, which would pin a stale list.
+    """
+    personas_state = st.session_state.get("personas", {"normal": [], "impersonation": []})
+    current_mode = st.radio(
+        "Mode",
+        options=["normal", "impersonation"],
+        index=0 if st.session_state.get("mode", "normal") == "normal" else 1,
+        horizontal=True,
+        key="mode",
+        help="Normal: preset personas. Impersonation: dynamically cloned voices (refresh after a call).",
+    )
+    persona_choices = personas_state.get(current_mode) or []
+    disabled = len(persona_choices) == 0
+    st.selectbox(
+        "Persona",
+        persona_choices if not disabled else ["(No personas available)"],
+        index=0,
+        disabled=disabled,
+        key="persona",
+        help="Select a persona. Use the Refresh button after a successful call to load new impersonation voices.",
+    )
+
+    # Optional ElevenLabs voice ID for normal mode only
+    is_normal_mode = current_mode == "normal"
+    st.text_input(
+        "ElevenLabs voice ID (optional)",
+        value=("UgBBYS2sOqTuMpoF3BR0" if is_normal_mode else ""),
+        placeholder="UgBBYS2sOqTuMpoF3BR0",
+        disabled=not is_normal_mode,
+        key="voice_id",
+        help=(
+            "Provide a specific voice for normal mode."
+        ),
+    )
+    if is_normal_mode:
+        st.caption(
+            "Reference: Twilio TTS voices and languages – https://www.twilio.com/docs/voice/twiml/say/text-speech#available-voices-and-languages"
+        )
 
 
 def validate_phone(ph: str) -> tuple[bool, str]:
@@ -54,19 +275,23 @@ def validate_phone(ph: str) -> tuple[bool, str]:
     """
     if not ph:
         return False, "Phone number is required."
-    if not re.fullmatch(r"\+?[1-9]\d{7,14}", ph):
+    if not _E164_RE.fullmatch(ph):
         return False, "Enter a valid E.164 phone (e.g., +15551234567)."
     return True, ""
 
 
+@functools.lru_cache(maxsize=8192)
 def format_timestamp(timestamp) -> str:
     """Convert timestamp (milliseconds) to readable date string in IST.
-    
+
     Args:
         timestamp: Unix timestamp in milliseconds (can be int, float, or string)
-    
+
     Returns:
         Formatted date string in IST (e.g., "Dec 31, 2025 at 3:45 PM IST")
+
+    Memoized: the same timestamps are formatted on every rerun, so repeat
+    calls are a dict lookup instead of fromtimestamp + strftime.
     """
     if not timestamp:
         return "N/A"
@@ -75,10 +300,8 @@ def format_timestamp(timestamp) -> str:
         ts = float(timestamp)
         if ts == 0:
             return "N/A"
-        # Create IST timezone (UTC+5:30)
-        ist = timezone(timedelta(hours=5, minutes=30))
         # Convert from milliseconds to seconds and create datetime in IST
-        dt = datetime.fromtimestamp(ts / 1000, tz=ist)
+        dt = datetime.fromtimestamp(ts / 1000, tz=_IST)
         return dt.strftime("%b %d, %Y at %I:%M %p IST")
     except (ValueError, TypeError, OSError):
         return "N/A"
@@ -92,18 +315,34 @@ def place_call(
     voice_id: Optional[str] = None,
 ) -> dict:
     """POST /call to initiate a vishing simulation call."""
-    payload = {"ph": ph, "name": name, "persona": persona, "mode": mode}
-    if voice_id:
-        payload["voice_id"] = voice_id
+    requests = _requests()
+    # Serialize once with orjson (bytes out) instead of going through
+    # requests' stdlib json encoder + str->bytes encode.
+    body = orjson.dumps(
+        {
+            "ph": ph,
+            "name": name,
+            "persona": persona,
+            "mode": mode,
+            **({"voice_id": voice_id} if voice_id else {}),
+        }
+    )
     try:
         backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
-        resp = requests.post(f"{backend_url}/call", json=payload, timeout=30)
-        # Try reading JSON either way for helpful messages
+        resp = get_http_session().post(
+            f"{backend_url}/call",
+            data=body,
+            headers={"content-type": "application/json"},
+            timeout=30,
+        )
+        # Parse the body once, for helpful messages on both paths — and only
+        # when the server actually declared a JSON body.
         content = None
-        try:
-            content = resp.json()
-        except Exception:
-            content = None
+        if "application/json" in resp.headers.get("content-type", "") and resp.content:
+            try:
+                content = orjson.loads(resp.content)
+            except orjson.JSONDecodeError:
+                content = None
 
         if resp.status_code >= 400:
             message = None
@@ -120,38 +359,61 @@ def place_call(
         raise RuntimeError(f"Failed to place call: {e}") from e
 
 
-def fetch_calls() -> List[dict]:
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_calls(backend_url: str) -> List[dict]:
     """Fetch list of all calls from backend, sorted by timestamp (newest first).
-    
+
     Returns a list of dicts with: name, ph, callSid, timestamp (sorted descending).
     Raises RuntimeError on any failure.
+
+    Cached briefly (keyed on backend_url, like the detail/report fetchers) so
+    unrelated widget reruns — search keystrokes, tab switches — don't refire
+    the list fetch and its legacy fan-out; the Refresh button clears it.
     """
+    requests = _requests()
     try:
-        backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
-        resp = requests.get(f"{backend_url}/calls", timeout=15)
+        resp = get_http_session().get(f"{backend_url}/calls", timeout=15)
         resp.raise_for_status()
-        data = resp.json() or {}
+        data = (orjson.loads(resp.content) if resp.content else {}) or {}
         calls = data.get("calls") or []
         
-        # Fetch timestamp for each call and sort by timestamp (newest first)
-        calls_with_timestamps = []
-        for call in calls:
-            try:
-                call_details = fetch_call_details(call["callSid"])
-                timestamp = call_details.get("timestamp", 0)
-                calls_with_timestamps.append({
-                    **call,
-                    "timestamp": timestamp
-                })
-            except Exception:
-                # If timestamp fetch fails, use 0 as fallback
-                calls_with_timestamps.append({
-                    **call,
-                    "timestamp": 0
-                })
-        
-        # Sort by timestamp descending (newest first)
-        sorted_calls = sorted(calls_with_timestamps, key=lambda x: x.get("timestamp", 0), reverse=True)
+        # Newer backends include the timestamp inline in the /calls payload;
+        # probe the first record and skip the N+1 detail fan-out entirely.
+        if calls and "timestamp" in calls[0]:
+            # itemgetter is C-implemented, so default the key first and skip
+            # the per-comparison lambda frame.
+            for call in calls:
+                call.setdefault("timestamp", 0)
+            sorted_calls = sorted(calls, key=itemgetter("timestamp"), reverse=True)
+        else:
+            # Legacy backends: fetch timestamps for all calls concurrently and
+            # sort (newest first). The detail GETs are independent, so fan them
+            # out over the shared executor instead of paying one serial
+            # round-trip per call.
+            futures = {
+                get_executor().submit(fetch_call_details, backend_url, call["callSid"]): call
+                for call in calls
+            }
+            for fut in as_completed(futures):
+                call = futures[fut]
+                try:
+                    call["timestamp"] = fut.result().get("timestamp", 0)
+                except Exception:
+                    # If timestamp fetch fails, use 0 as fallback
+                    call["timestamp"] = 0
+
+            # Sort by timestamp descending (newest first). The list is
+            # freshly parsed from JSON and not shared, so mutating the call
+            # dicts and sorting in place avoids a full copy per record.
+            # Every record got a timestamp in the fan-out above, so the
+            # C-implemented itemgetter can replace the lambda key.
+            calls.sort(key=itemgetter("timestamp"), reverse=True)
+            sorted_calls = calls
+
+        # Pre-format the display timestamp once per fetch so the selectbox
+        # label comprehension is a plain dict lookup on every rerun.
+        for call in sorted_calls:
+            call["_ts_display"] = format_timestamp(call.get("timestamp", 0))
         return sorted_calls
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to fetch calls: {e}") from e
@@ -159,17 +421,21 @@ def fetch_calls() -> List[dict]:
         raise RuntimeError("Invalid response while fetching calls") from e
 
 
-def fetch_call_details(call_sid: str) -> dict:
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_call_details(backend_url: str, call_sid: str) -> dict:
     """Fetch full details for a specific call.
-    
+
     Returns the call data dict.
     Raises RuntimeError on any failure.
+
+    Cached per (backend_url, call_sid) — completed calls are immutable, and
+    keying on the URL means a sidebar URL change misses the cache naturally.
     """
+    requests = _requests()
     try:
-        backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
-        resp = requests.get(f"{backend_url}/calls/{call_sid}", timeout=15)
+        resp = get_http_session().get(f"{backend_url}/calls/{call_sid}", timeout=15)
         resp.raise_for_status()
-        data = resp.json() or {}
+        data = (orjson.loads(resp.content) if resp.content else {}) or {}
         if not data.get("success"):
             raise RuntimeError(data.get("error", "Failed to fetch call details"))
         return data.get("data") or {}
@@ -179,17 +445,20 @@ def fetch_call_details(call_sid: str) -> dict:
         raise RuntimeError("Invalid response while fetching call details") from e
 
 
-def fetch_report(call_sid: str) -> dict:
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_report(backend_url: str, call_sid: str) -> dict:
     """Fetch report data for a specific call.
-    
+
     Returns a dict with: report (markdown), transcript, name, ph.
     Raises RuntimeError on any failure.
+
+    Cached per (backend_url, call_sid), same rationale as fetch_call_details.
     """
+    requests = _requests()
     try:
-        backend_url = st.session_state.get("backend_url", DEFAULT_BACKEND_URL)
-        resp = requests.get(f"{backend_url}/reports/{call_sid}", timeout=15)
+        resp = get_http_session().get(f"{backend_url}/reports/{call_sid}", timeout=15)
         resp.raise_for_status()
-        data = resp.json() or {}
+        data = (orjson.loads(resp.content) if resp.content else {}) or {}
         if not data.get("success"):
             raise RuntimeError(data.get("error", "Failed to fetch report"))
         return data.get("data") or {}
@@ -230,11 +499,15 @@ with st.sidebar:
 st.caption(f"Backend: {st.session_state.get('backend_url', DEFAULT_BACKEND_URL)}")
 
 
-# Prefetch personas on first load
+# Prefetch personas on first load. The SWR layer serves a warm snapshot
+# instantly; only a genuinely cold start blocks on the synchronous fetch.
+# (This must stay on the script thread: executor workers have no
+# ScriptRunContext, so their st.session_state writes go to a throwaway
+# state and nothing would trigger a repaint when the data lands.)
 if "personas" not in st.session_state:
     try:
         with st.spinner("Loading personas…"):
-            st.session_state["personas"] = fetch_personas()
+            st.session_state["personas"] = get_personas_swr()
     except Exception as e:
         st.session_state["personas"] = {"normal": [], "impersonation": []}
         st.error(str(e))
@@ -259,47 +532,17 @@ with tab1:
         except Exception as e:
             st.error(str(e))
 
-    # Move mode selector OUTSIDE the form so changing it updates the persona list immediately
-    mode = st.radio(
-        "Mode",
-        options=["normal", "impersonation"],
-        index=0 if st.session_state.get("mode", "normal") == "normal" else 1,
-        horizontal=True,
-        key="mode",
-        help="Normal: preset personas. Impersonation: dynamically cloned voices (refresh after a call).",
-    )
+    # Bind session state to locals once per rerun instead of re-probing the
+    # descriptor-backed dict inside the form.
+    personas_state = st.session_state["personas"]
+
+    # Mode/persona/voice widgets live in a fragment so toggling them reruns
+    # only that block; their values are read back from session state on submit.
+    persona_form_block()
 
     with st.form("place_call_form", clear_on_submit=False, border=True):
         ph = st.text_input("Target phone (E.164)", placeholder="+15551234567")
         name = st.text_input("Target name", placeholder="Jane Doe")
-        # Use the selected mode from session state so the selectbox updates on toggle
-        personas = st.session_state.get("personas", {"normal": [], "impersonation": []})
-        current_mode = st.session_state.get("mode", "normal")
-        persona_choices = personas.get(current_mode) or []
-        disabled = len(persona_choices) == 0
-        persona = st.selectbox(
-            "Persona",
-            persona_choices if not disabled else ["(No personas available)"],
-            index=0,
-            disabled=disabled,
-            help="Select a persona. Use the Refresh button after a successful call to load new impersonation voices.",
-        )
-
-        # Optional ElevenLabs voice ID for normal mode only
-        is_normal_mode = current_mode == "normal"
-        voice_id = st.text_input(
-            "ElevenLabs voice ID (optional)",
-            value=("UgBBYS2sOqTuMpoF3BR0" if is_normal_mode else ""),
-            placeholder="UgBBYS2sOqTuMpoF3BR0",
-            disabled=not is_normal_mode,
-            help=(
-                "Provide a specific voice for normal mode."
-            ),
-        )
-        if is_normal_mode:
-            st.caption(
-                "Reference: Twilio TTS voices and languages – https://www.twilio.com/docs/voice/twiml/say/text-speech#available-voices-and-languages"
-            )
 
         st.markdown(
             "**Consent notice**"
@@ -315,6 +558,13 @@ with tab1:
         submitted = st.form_submit_button("Place call", type="primary")
 
         if submitted:
+            # Pull the fragment's widget values back out of session state.
+            current_mode = st.session_state.get("mode", "normal")
+            is_normal_mode = current_mode == "normal"
+            persona = st.session_state.get("persona")
+            voice_id = st.session_state.get("voice_id", "")
+            disabled = len(personas_state.get(current_mode) or []) == 0
+
             ok, msg = validate_phone(ph)
             if not ok:
                 st.error(msg)
@@ -359,11 +609,14 @@ with tab2:
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh", help="Reload the list of calls from the server", use_container_width=True):
+            fetch_calls.clear()
+            fetch_call_details.clear()
+            fetch_report.clear()
             st.rerun()
     
     try:
         with st.spinner("Loading calls…"):
-            calls = fetch_calls()
+            calls = fetch_calls(st.session_state["backend_url"])
         
         if not calls:
             st.info("No calls found. Place a call first using the 'Place Call' tab.")
@@ -377,14 +630,25 @@ with tab2:
                     help="Filter calls by target name or phone number"
                 )
             
+            # Build the lowercase search index once per calls snapshot, so
+            # each keystroke costs one substring test per call instead of
+            # re-lowering name and phone every time.
+            call_sids = [call.get("callSid") for call in calls]
+            if st.session_state.get("_search_blob_sids") != call_sids:
+                st.session_state["_search_blobs"] = [
+                    (call.get("name", "") + "\x00" + call.get("ph", "")).lower()
+                    for call in calls
+                ]
+                st.session_state["_search_blob_sids"] = call_sids
+            search_blobs = st.session_state["_search_blobs"]
+
             # Filter calls based on search query
             filtered_calls = calls
             if search_query.strip():
                 search_lower = search_query.lower()
                 filtered_calls = [
-                    call for call in calls
-                    if search_lower in call.get("name", "").lower() 
-                    or search_lower in call.get("ph", "").lower()
+                    call for call, blob in zip(calls, search_blobs)
+                    if search_lower in blob
                 ]
             
             # Display call count
@@ -393,8 +657,17 @@ with tab2:
             if not filtered_calls:
                 st.warning("No calls match your search criteria.")
             else:
-                # Create a display name for each call with timestamp
-                call_options = [f"{call['name']} • {call['ph']} • {format_timestamp(call.get('timestamp', 0))}" for call in filtered_calls]
+                # Create a display name for each call with timestamp.
+                # Rebuilt only when the filter result changes, so typing and
+                # tab switches reuse the formatted labels from session state.
+                label_key = (search_query, tuple(call.get("callSid") for call in filtered_calls))
+                if st.session_state.get("_call_label_key") != label_key:
+                    st.session_state["_call_labels"] = [
+                        f"{call['name']} • {call['ph']} • {call.get('_ts_display', 'N/A')}"
+                        for call in filtered_calls
+                    ]
+                    st.session_state["_call_label_key"] = label_key
+                call_options = st.session_state["_call_labels"]
                 selected_idx = st.selectbox(
                     "Select a call to view details",
                     range(len(filtered_calls)),
@@ -413,25 +686,34 @@ with tab2:
                 with details_tab:
                     try:
                         with st.spinner("Loading call details…"):
-                            call_data = fetch_call_details(call_sid)
-                        
-                        # Display call details without truncation
-                        st.markdown("#### Call Information")
-                        st.write(f"**Name:** {call_data.get('name', 'N/A')}")
-                        st.write(f"**Phone:** {call_data.get('ph', call_data.get('phone', 'N/A'))}")
-                        st.write(f"**Mode:** {call_data.get('mode', 'N/A')}")
-                        st.write(f"**Persona:** {call_data.get('persona', 'N/A')}")
-                        st.write(f"**Call SID:** {call_sid}")
+                            call_data = fetch_call_details(
+                                st.session_state["backend_url"], call_sid
+                            )
                         
-                        # Display timestamp if available
+                        # Display call details without truncation, coalesced
+                        # into one markdown element (one frontend message
+                        # instead of six-plus st.write calls per rerun).
+                        info_lines = [
+                            "#### Call Information",
+                            f"**Name:** {call_data.get('name', 'N/A')}",
+                            f"**Phone:** {call_data.get('ph', call_data.get('phone', 'N/A'))}",
+                            f"**Mode:** {call_data.get('mode', 'N/A')}",
+                            f"**Persona:** {call_data.get('persona', 'N/A')}",
+                            f"**Call SID:** {call_sid}",
+                        ]
+
+                        # Include timestamp if available
                         timestamp = call_data.get("timestamp", 0)
                         if timestamp:
-                            st.write(f"**Date & Time:** {format_timestamp(timestamp)}")
-                        
-                        # Display voice_id if available
-                        voice_id = call_data.get("voice_id")
-                        if voice_id:
-                            st.write(f"**Voice ID:** {voice_id}")
+                            info_lines.append(f"**Date & Time:** {format_timestamp(timestamp)}")
+
+                        # Include voice_id if available (local is named
+                        # call_voice_id to avoid shadowing the form's input)
+                        call_voice_id = call_data.get("voice_id")
+                        if call_voice_id:
+                            info_lines.append(f"**Voice ID:** {call_voice_id}")
+
+                        st.markdown("\n\n".join(info_lines))
                         
                         st.divider()
                         
@@ -445,7 +727,9 @@ with tab2:
                 with report_tab:
                     try:
                         with st.spinner("Loading report…"):
-                            report_data = fetch_report(call_sid)
+                            report_data = fetch_report(
+                                st.session_state["backend_url"], call_sid
+                            )
                         
                         # Display report as markdown
                         report_content = report_data.get("report", "")